@@ -0,0 +1,8 @@
+"""FastAPI dependencies shared by routers and providers."""
+import httpx
+from fastapi import Request
+
+
+def get_http_client(request: Request) -> httpx.AsyncClient:
+    """Return the app-wide pooled HTTP client created in the lifespan."""
+    return request.app.state.http_client
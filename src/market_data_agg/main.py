@@ -1,14 +1,39 @@
 """Main module for the market data aggregation service."""
+import os
 import subprocess
 import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
+import httpx
 import uvicorn
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 
-app = FastAPI()
+# Outbound HTTP client settings for calls to market data providers.
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "5.0"))
+HTTP_LIMITS = httpx.Limits(
+    max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", "200")),
+    max_keepalive_connections=int(os.getenv("HTTP_MAX_KEEPALIVE", "100")),
+    keepalive_expiry=float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30")),
+)
 
 
+@asynccontextmanager
+async def lifespan(application: FastAPI) -> AsyncIterator[None]:
+    """Hold one pooled HTTP client for all provider calls; close it on shutdown."""
+    application.state.http_client = httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+    try:
+        yield
+    finally:
+        await application.state.http_client.aclose()
+
+
+app = FastAPI(lifespan=lifespan)
+# Only wraps HTTP responses; WebSocket traffic passes through untouched.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 
 @app.get("/")
 def health():
@@ -1,29 +1,46 @@
 """Pydantic schemas for API and runtime use. Not persisted to DB."""
-from datetime import datetime
+from datetime import UTC, datetime
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field
 
-from market_data_agg.db import Source
+# Values of db.Source. A Literal is checked in pydantic-core and stored as a
+# plain str, so neither validation nor serialization goes through the enum.
+SourceValue = Literal["stock", "crypto", "polymarket"]
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC and convert aware ones to UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+# Always tz-aware UTC, so quotes from any caller stay comparable and sortable.
+UtcDatetime = Annotated[datetime, AfterValidator(_as_utc)]
 
 
 class MarketQuote(BaseModel):
-    """Unified quote across providers (stock, crypto, polymarket)."""
+    """Unified quote across providers (stock, crypto, polymarket).
+
+    `source` is a plain str at runtime (a Source value), not a Source member.
+    """
 
-    source: Source
+    source: SourceValue
     symbol: str
     value: float  # price or probability (0–1 for prediction markets)
     volume: float | None = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: UtcDatetime = Field(default_factory=lambda: datetime.now(UTC))
     metadata: dict | None = None
 
 
 class StreamMessage(BaseModel):
-    """WebSocket push payload for real-time streaming."""
+    """WebSocket push payload for real-time streaming; `source` is a plain str."""
 
-    source: Source
+    source: SourceValue
     symbol: str
     price: float
-    timestamp: datetime
+    timestamp: UtcDatetime
 
 
-__all__ = ["MarketQuote", "StreamMessage"]
+__all__ = ["MarketQuote", "SourceValue", "StreamMessage"]
@@ -0,0 +1,24 @@
+"""Tests for shared FastAPI dependencies."""
+import httpx
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from market_data_agg.dependencies import get_http_client
+from market_data_agg.main import lifespan
+
+
+def test_get_http_client_returns_lifespan_client():
+    app = FastAPI(lifespan=lifespan)
+    seen: list[httpx.AsyncClient] = []
+
+    @app.get("/client")
+    def client_route(client: httpx.AsyncClient = Depends(get_http_client)):
+        seen.append(client)
+        return {}
+
+    with TestClient(app) as test_client:
+        test_client.get("/client")
+        test_client.get("/client")
+        assert seen[0] is seen[1] is app.state.http_client
+        assert not seen[0].is_closed
+    assert seen[0].is_closed
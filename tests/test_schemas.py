@@ -0,0 +1,64 @@
+"""Tests for the quote schemas."""
+from datetime import UTC, datetime, timedelta, timezone
+from typing import get_args
+
+import pytest
+from pydantic import ValidationError
+
+from market_data_agg.db import Source
+from market_data_agg.schemas import MarketQuote, SourceValue, StreamMessage
+
+
+def _quote(**kwargs) -> MarketQuote:
+    return MarketQuote(source=Source.STOCK, symbol="AAPL", value=1.0, **kwargs)
+
+
+def test_source_value_matches_db_source():
+    assert get_args(SourceValue) == tuple(s.value for s in Source)
+
+
+def test_source_stored_as_plain_str():
+    quote = _quote()
+    assert type(quote.source) is str
+    assert quote.source == "stock"
+    assert type(StreamMessage(source="crypto", symbol="BTC", price=1.0,
+                              timestamp=datetime.now(UTC)).source) is str
+
+
+def test_invalid_source_rejected():
+    with pytest.raises(ValidationError):
+        MarketQuote(source="forex", symbol="EURUSD", value=1.0)
+
+
+def test_source_json_schema_enum():
+    schema = MarketQuote.model_json_schema()["properties"]["source"]
+    assert schema["enum"] == ["stock", "crypto", "polymarket"]
+
+
+def test_naive_timestamp_treated_as_utc():
+    quote = _quote(timestamp=datetime(2026, 1, 1, 12, 0))
+    assert quote.timestamp == datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    assert quote.timestamp.tzinfo is UTC
+
+
+def test_aware_timestamp_converted_to_utc():
+    plus_two = timezone(timedelta(hours=2))
+    quote = _quote(timestamp=datetime(2026, 1, 1, 12, 0, tzinfo=plus_two))
+    assert quote.timestamp == datetime(2026, 1, 1, 10, 0, tzinfo=UTC)
+    assert quote.timestamp.tzinfo is UTC
+
+
+def test_stream_message_timestamp_normalized():
+    message = StreamMessage(source="crypto", symbol="BTC", price=1.0,
+                            timestamp="2026-01-01T00:00:00")
+    assert message.timestamp == datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def test_mixed_timestamps_sort():
+    quotes = [
+        _quote(),
+        _quote(timestamp=datetime(2026, 1, 1)),
+        _quote(timestamp=datetime(2026, 1, 1, tzinfo=timezone(timedelta(hours=2)))),
+    ]
+    ordered = sorted(quotes, key=lambda q: q.timestamp)
+    assert [q.timestamp.hour for q in ordered[:2]] == [22, 0]